@@ -1,14 +1,24 @@
 """
 캔들 분석 로직
 """
-from typing import List, Tuple, Dict
-from .models import CandleData
+from typing import List
+from .models import CandleData, OPEN, HIGH, LOW, CLOSE, VOLUME
+
+
+def _amount_from_fields(open_: int, high: int, low: int, close: int, volume: int) -> float:
+    """OHLCV 값으로 거래대금 계산 (억원 단위)"""
+    avg_price = (open_ + high + low + close) / 4
+    return volume * avg_price / 100000000
 
 
 def get_trading_amount(candle: CandleData) -> float:
     """거래대금 계산 (억원 단위)"""
-    avg_price = (candle.open + candle.high + candle.low + candle.close) / 4
-    return candle.volume * avg_price / 100000000
+    return _amount_from_fields(candle.open, candle.high, candle.low, candle.close, candle.volume)
+
+
+def get_trading_amount_list(values: List[int]) -> float:
+    """[open, high, low, close, volume] 리스트로 거래대금 계산 (억원 단위, CandleData 생성 없음)"""
+    return _amount_from_fields(values[OPEN], values[HIGH], values[LOW], values[CLOSE], values[VOLUME])
 
 
 def is_amount_above_threshold(candle: CandleData, threshold_billion: float) -> bool:
@@ -31,6 +41,11 @@ def is_bullish_candle(candle: CandleData) -> bool:
     return candle.close > candle.open
 
 
+def is_bullish_candle_list(values: List[int]) -> bool:
+    """[open, high, low, close, volume] 리스트로 양봉 체크"""
+    return values[CLOSE] > values[OPEN]
+
+
 def check_body_tail_ratio(candle: CandleData, min_ratio: float) -> bool:
     """몸통이 윗꼬리보다 min_ratio배 이상인지 체크"""
     body = candle.close - candle.open
@@ -38,14 +53,10 @@ def check_body_tail_ratio(candle: CandleData, min_ratio: float) -> bool:
     return body > upper_tail * min_ratio
 
 
-def calculate_prev_avg_amount(prev_candles: List[Tuple[str, Dict]], lookback: int) -> float:
-    """이전 N개 분봉의 평균 거래대금 계산"""
-    # 부분 데이터를 건너뛰기 위해 lookback+1개 이상 필요
-    if len(prev_candles) < lookback + 1:
-        return 0.0
+def check_body_tail_ratio_list(values: List[int], min_ratio: float) -> bool:
+    """[open, high, low, close, volume] 리스트로 몸통이 윗꼬리보다 min_ratio배 이상인지 체크"""
+    close = values[CLOSE]
+    body = close - values[OPEN]
+    upper_tail = values[HIGH] - close
+    return body > upper_tail * min_ratio
 
-    amounts = [
-        get_trading_amount(CandleData(**data))
-        for _, data in prev_candles[-lookback:]
-    ]
-    return sum(amounts) / len(amounts) if amounts else 0.0
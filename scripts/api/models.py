@@ -4,8 +4,11 @@
 """
 from dataclasses import dataclass
 
+# 진행 중 분봉 리스트 [open, high, low, close, volume] 인덱스
+OPEN, HIGH, LOW, CLOSE, VOLUME = range(5)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class CandleData:
     """불변 캔들 데이터"""
     open: int
@@ -15,7 +18,7 @@ class CandleData:
     volume: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AlertInfo:
     """불변 알림 정보"""
     time: str
@@ -5,6 +5,11 @@ Telegram Bot 알림 시스템
 from datetime import datetime
 from typing import Optional, Dict, Callable
 import requests
+from requests.adapters import HTTPAdapter
+
+
+class TelegramSendError(Exception):
+    """Telegram 메시지 전송 실패 (네트워크 오류 또는 API 오류 응답)"""
 
 
 class TelegramBot:
@@ -21,6 +26,9 @@ class TelegramBot:
         self.chat_id = chat_id
         self.logger = logger or print
         self.is_connected = False
+        # HTTP keep-alive 세션 (알림마다 TCP/TLS 연결을 새로 맺지 않도록 재사용)
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=4))
 
     def connect(self) -> bool:
         """
@@ -31,7 +39,7 @@ class TelegramBot:
         """
         try:
             url = f"https://api.telegram.org/bot{self.token}/getMe"
-            response = requests.get(url, timeout=5)
+            response = self.session.get(url, timeout=5)
 
             if response.status_code == 200:
                 bot_info = response.json()
@@ -54,15 +62,14 @@ class TelegramBot:
 
         Args:
             message: 알림 메시지 (Markdown 형식)
+
+        Raises:
+            TelegramSendError: 전송 실패 시 (재전송 여부는 호출 측에서 결정)
         """
         if not self.is_connected:
             return
 
-        try:
-            self._send_message(message)
-
-        except Exception as e:
-            self.logger(f"❌ Telegram 알림 전송 오류: {str(e)}")
+        self._send_message(message)
 
     def send_start_message(self, message_body: str):
         """
@@ -108,26 +115,35 @@ class TelegramBot:
         except Exception as e:
             self.logger(f"❌ Telegram 종료 메시지 전송 오류: {str(e)}")
 
+    def close(self):
+        """HTTP 세션 종료"""
+        self.session.close()
+
     def _send_message(self, message: str):
         """
         Telegram API 호출 (내부 메서드)
 
         Args:
             message: 전송할 메시지 (Markdown 형식)
+
+        Raises:
+            TelegramSendError: 네트워크 오류 또는 API 오류 응답
         """
-        try:
-            url = f"https://api.telegram.org/bot{self.token}/sendMessage"
-            data = {
-                'chat_id': self.chat_id,
-                'text': message,
-                'parse_mode': 'Markdown'
-            }
+        url = f"https://api.telegram.org/bot{self.token}/sendMessage"
+        data = {
+            'chat_id': self.chat_id,
+            'text': message,
+            'parse_mode': 'Markdown'
+        }
 
-            response = requests.post(url, json=data, timeout=5)
+        try:
+            response = self.session.post(url, json=data, timeout=5)
+        except requests.RequestException as e:
+            raise TelegramSendError(str(e)) from e
 
-            if response.status_code != 200:
+        if response.status_code != 200:
+            try:
                 error_msg = response.json().get('description', 'Unknown error')
-                self.logger(f"❌ Telegram 메시지 전송 실패: {error_msg}")
-
-        except Exception as e:
-            raise e
+            except ValueError:
+                error_msg = 'Unknown error'
+            raise TelegramSendError(f"HTTP {response.status_code}: {error_msg}")
@@ -2,6 +2,10 @@
 데이터 포맷팅 유틸리티 함수
 UI 표시용 문자열 변환
 """
+import time
+
+# (초, "HH:MM:SS") - 튜플 하나로 교체하므로 여러 스레드에서 읽어도 안전
+_clock_cache = (-1, "")
 
 
 def format_price(price: int) -> str:
@@ -17,3 +21,14 @@ def format_amount(amount: float) -> str:
 def format_ratio(ratio: float) -> str:
     """배수 포맷팅"""
     return f"{ratio:.1f}x"
+
+
+def format_clock() -> str:
+    """현재 시각 HH:MM:SS 포맷팅 (같은 초 안에서는 포맷된 문자열 재사용)"""
+    global _clock_cache
+    now_second = int(time.time())
+    cached_second, text = _clock_cache
+    if now_second != cached_second:
+        text = time.strftime('%H:%M:%S', time.localtime(now_second))
+        _clock_cache = (now_second, text)
+    return text
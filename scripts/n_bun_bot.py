@@ -7,11 +7,12 @@ import sys
 import time
 import queue
 import pythoncom
+import win32event
 import traceback
 import threading
-from datetime import datetime
-from collections import deque
-from typing import Dict, Tuple, Optional, List, Deque
+from dataclasses import dataclass
+from collections import deque, defaultdict
+from typing import Dict, DefaultDict, Tuple, Optional, List, Deque
 
 from dotenv import load_dotenv
 from pykiwoom.kiwoom import Kiwoom
@@ -19,18 +20,13 @@ from pykiwoom.kiwoom import Kiwoom
 # Add project root to Python path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from scripts.api.utils import safe_int  # noqa: E402
 from scripts.api.screening import screen_by_custom_condition, screen_by_program  # noqa: E402
-from scripts.api.models import CandleData, AlertInfo  # noqa: E402
+from scripts.api.models import CandleData, AlertInfo, HIGH, LOW, CLOSE, VOLUME  # noqa: E402
 from scripts.api.candle_analysis import (  # noqa: E402
-    get_trading_amount,
-    is_bullish_candle,
-    check_body_tail_ratio,
-    calculate_prev_avg_amount
-)
+    get_trading_amount_list, is_bullish_candle_list, check_body_tail_ratio_list)
 from scripts.api.filters import check_ma_alignment, check_trader_sell_dominance  # noqa: E402
-from scripts.api.utils.formatters import format_price, format_amount, format_ratio  # noqa: E402
-from scripts.api.telegram_bot import TelegramBot  # noqa: E402
+from scripts.api.utils.formatters import format_price, format_amount, format_ratio, format_clock  # noqa: E402
+from scripts.api.telegram_bot import TelegramBot, TelegramSendError  # noqa: E402
 
 load_dotenv()
 
@@ -66,29 +62,108 @@ class Config:
     THROTTLE_SECONDS = 10  # 동일 종목 재체크 방지 시간 (초)
 
 
+# ============================================================================
+# 종목별 실시간 상태
+# ============================================================================
+@dataclass(slots=True)
+class CodeState:
+    """종목별 실시간 상태 (틱마다 종목코드 dict 조회를 한 번으로 줄이기 위해 한 객체에 모음)"""
+    name: str
+    prev_amounts: Deque[float]  # 확정 분봉 거래대금 (최근 LOOKBACK+1개)
+    minute: str = ""  # 진행 중 분봉의 분 ("HHMM")
+    candle: Optional[List[int]] = None  # 진행 중 분봉 [o, h, l, c, v]
+    prev_amount_sum: float = 0.0  # 최근 LOOKBACK개 분봉 거래대금 합계
+    prev_avg_amount: float = 0.0  # 최근 LOOKBACK개 분봉 평균 거래대금 (데이터 부족 시 0)
+    amount_threshold: float = float('inf')  # 급증 판정 기준 거래대금
+    alerted_minute: str = ""  # 마지막으로 알림을 보낸 분
+    last_check_ns: int = -(1 << 62)  # 마지막 조건 체크 시각 (time.monotonic_ns, 초기값은 첫 체크 항상 통과)
+
+
+# ============================================================================
+# 실시간 데이터 변환
+# ============================================================================
+def _parse_abs_int(value: str) -> int:
+    """실시간 데이터 문자열("+61000", "-61000")을 절대값 정수로 변환 (실패 시 0)"""
+    try:
+        number = int(value)
+    except (ValueError, TypeError):
+        return 0
+    return -number if number < 0 else number
+
+
+# 실시간 타입: 주식체결
+_REAL_TYPE_TRADE = "주식체결"
+
+# 주식체결 sRealData 필드 순서 (탭 구분): 20=체결시간, 10=현재가, 11=전일대비,
+# 12=등락율, 27=매도호가, 28=매수호가, 15=거래량, ...
+_REAL_TIME_INDEX = 0
+_REAL_PRICE_INDEX = 1
+_REAL_VOLUME_INDEX = 6
+
+
+def _parse_real_data(real_data: str) -> Optional[Tuple[int, int, str]]:
+    """
+    주식체결 sRealData 문자열에서 (현재가, 거래량, 체결시간) 추출
+
+    Returns:
+        (price, volume, exec_time_str) | None: 형식이 예상과 다르면 None
+    """
+    parts = real_data.split('\t', _REAL_VOLUME_INDEX + 1)
+    if len(parts) <= _REAL_VOLUME_INDEX:
+        return None
+    exec_time_str = parts[_REAL_TIME_INDEX]
+    if len(exec_time_str) != 6 or not exec_time_str.isdigit():
+        return None
+    price = _parse_abs_int(parts[_REAL_PRICE_INDEX])
+    volume = _parse_abs_int(parts[_REAL_VOLUME_INDEX])
+    return price, volume, exec_time_str
+
+
+# TR 필터 요청 payload 재사용 풀 최대 크기
+_PAYLOAD_POOL_SIZE = 64
+
+# 텔레그램 알림 묶음 전송 설정
+_TELEGRAM_BATCH_WINDOW = 0.1  # 첫 메시지 이후 추가 메시지를 기다리는 시간 (초)
+_TELEGRAM_BATCH_SEPARATOR = "\n---\n"
+_TELEGRAM_MAX_LENGTH = 4096  # 텔레그램 메시지 최대 길이
+
+# 처리되지 않은 예외 출력 제한
+_ERROR_WINDOW_SECONDS = 60  # 집계 구간 (초)
+_ERROR_LOG_LIMIT = 3  # 구간별 예외 종류당 출력 건수
+
+
 # ============================================================================
 # 알림 조건 체크 함수 (TR 조회 없음)
 # ============================================================================
 def should_alert(
-    candle: CandleData,
-    prev_candles: List[Tuple[str, Dict]],
+    values: List[int],
+    avg_prev_amount: float,
+    amount_threshold: float,
     code: str,
-    program_top_codes: List[str],
+    program_ranks: Dict[str, int],
     config: Config
 ) -> Tuple[bool, Optional[Tuple[float, float, float, int]]]:
     """
     1단계 필터링: TR 조회 없이 빠른 조건 체크
+
+    진행 중 분봉 리스트를 그대로 받아 지역 변수로 계산 (틱마다 CandleData 생성 없음)
+
+    Args:
+        values: 진행 중 분봉 [open, high, low, close, volume]
+        avg_prev_amount: 이전 LOOKBACK개 분봉 평균 거래대금 (데이터 부족 시 0)
+        amount_threshold: 급증 판정 기준 거래대금 (avg_prev_amount * AMOUNT_MULTIPLIER)
+        program_ranks: 프로그램 순매수 상위 종목코드 -> 순위 (1부터)
     """
     # 1. 양봉 체크
-    if not is_bullish_candle(candle):
+    if not is_bullish_candle_list(values):
         return False, None
 
     # 2. 몸통/윗꼬리 비율 체크
     if config.ENABLE_BODY_TAIL:
-        if not check_body_tail_ratio(candle, config.BODY_TAIL_RATIO):
+        if not check_body_tail_ratio_list(values, config.BODY_TAIL_RATIO):
             return False, None
 
-    current_amount = get_trading_amount(candle)
+    current_amount = get_trading_amount_list(values)
 
     # 3. 최소 거래대금 체크
     if config.ENABLE_MIN_AMOUNT:
@@ -96,28 +171,22 @@ def should_alert(
             return False, None
 
     # 4. 거래대금 급증 체크
-    avg_prev_amount = 0
     ratio = 0
     if config.ENABLE_LOOKBACK:
-        if len(prev_candles) < config.LOOKBACK_CANDLES:
-            return False, None
-        avg_prev_amount = calculate_prev_avg_amount(
-            prev_candles, config.LOOKBACK_CANDLES)
         if avg_prev_amount <= 0:
             return False, None
-        ratio = current_amount / avg_prev_amount
-        if ratio < config.AMOUNT_MULTIPLIER:
-            print(f"[DEBUG] {code}: ✔️✔️✔️")
+        if current_amount < amount_threshold:
             return False, None
+        ratio = current_amount / avg_prev_amount
+    else:
+        avg_prev_amount = 0
 
     # 5. 프로그램 순매수 체크
     program_rank = 0
     if config.ENABLE_PROGRAM:
-        if code not in program_top_codes:
-            print(f"[DEBUG] {code}: ✔️✔️✔️✔️")
+        program_rank = program_ranks.get(code, 0)
+        if not program_rank:
             return False, None
-        program_rank = program_top_codes.index(code) + 1
-        print(f"[DEBUG] {code}: ✔️✔️✔️✔️✔️")
 
     return True, (current_amount, avg_prev_amount, ratio, program_rank)
 
@@ -132,23 +201,53 @@ class NBunBot:
         self.telegram_bot: Optional[TelegramBot] = None
         self.conditions: List[Tuple[int, str]] = []
 
-        # 실시간 데이터 저장소
-        self.minute_data: Dict[str, Deque[Tuple[str, Dict]]] = {}
-        self.ongoing_candles: Dict[str, Dict[str, Dict]] = {}
-        self.alerted: Dict[str, str] = {}
-        self.last_check_time: Dict[str, float] = {}
+        # 실시간 데이터 저장소 (종목코드 -> 종목별 상태, 모니터링 대상 종목만 포함)
+        self.states: Dict[str, CodeState] = {}
 
         # 캐시 및 상태
         self.monitoring_codes: List[str] = []
-        self.program_top_codes: List[str] = []
+        # 프로그램 순매수 상위 종목코드 -> 순위 (갱신 시 새 dict로 통째로 교체하므로 틱마다 복사 불필요)
+        self.program_ranks: Dict[str, int] = {}
         self.is_requesting = False  # TR 동시 조회 방지
         self.is_running = False
-        self.program_refresh_timer: Optional[threading.Timer] = None
-        self.request_queue = queue.Queue()  # 스레드 간 요청 큐
+        self.needs_tr_filters = False  # TR 필터 사용 여부 (시작 시 확정)
+        self._real_reg_batches: List[Tuple[str, str, str]] = []  # 실시간 등록 단위 (화면번호, 종목코드 목록, 등록 타입)
+        self.throttle_ns = int(config.THROTTLE_SECONDS * 1_000_000_000)  # 동일 종목 재체크 방지 시간 (ns)
+        self.program_refresh_thread: Optional[threading.Thread] = None
+        self._stop_evt = threading.Event()  # 보조 스레드 종료 신호
+        self._wake = win32event.CreateEvent(None, 0, 0, None)  # 다른 스레드에서 요청 추가 시 메인 루프 깨우기 (auto-reset)
+        self.request_queue: Deque[Tuple[str, Optional[Dict]]] = deque()  # 스레드 간 요청 큐 (append/popleft는 락 없이 안전)
+        self._payload_pool: List[Dict] = []  # 재사용할 TR 필터 요청 payload (메인 스레드 전용)
+        self.telegram_queue = queue.Queue()  # 텔레그램 전송 대기 메시지
+        self.telegram_thread: Optional[threading.Thread] = None
+
+        # 실시간 경로 로그 버퍼
+        self.pending_logs: Deque[str] = deque()  # 스레드 간 공유 (append/popleft는 락 없이 안전)
+
+        # 처리되지 않은 예외 집계 (예외 종류 -> 현재 구간 발생 건수)
+        self._err_count: DefaultDict[str, int] = defaultdict(int)
+        self._err_window_start = time.monotonic()
 
     def log(self, message: str):
         """콘솔에 로그 출력"""
-        print(f"[{datetime.now().strftime('%H:%M:%S')}] {message}")
+        print(f"[{format_clock()}] {message}")
+
+    def _log_buffered(self, message: str):
+        """실시간 처리 경로용 로그 (메인 루프에서 모아서 출력)"""
+        self.pending_logs.append(f"[{format_clock()}] {message}")
+
+    def _flush_logs(self):
+        """버퍼에 쌓인 로그를 한 번에 출력"""
+        if not self.pending_logs:
+            return
+        # clear() 대신 popleft()로 꺼내서 다른 스레드가 그 사이 추가한 로그 유실 방지
+        lines = []
+        while True:
+            try:
+                lines.append(self.pending_logs.popleft())
+            except IndexError:
+                break
+        print("\n".join(lines))
 
     def _connect_kiwoom(self):
         """Kiwoom API 연결 및 초기화"""
@@ -179,8 +278,63 @@ class NBunBot:
 
         self.telegram_bot = TelegramBot(token, chat_id, logger=self.log)
         self.telegram_bot.connect()
+
+        # 알림 전송은 별도 스레드에서 처리 (실시간 처리 중 네트워크 대기 방지)
+        self.telegram_thread = threading.Thread(
+            target=self._telegram_worker, daemon=True)
+        self.telegram_thread.start()
         self.log(f"✅ 텔레그램 연결 완료")
 
+    def _telegram_worker(self):
+        """(텔레그램 스레드에서 실행) 큐에 쌓인 알림 메시지를 짧은 구간 단위로 묶어서 전송"""
+        stopping = False
+        while not stopping:
+            message = self.telegram_queue.get()
+            if message is None:  # 종료 신호
+                break
+
+            # 첫 메시지 이후 일정 시간 동안 들어온 메시지를 한 번에 전송 (메시지 길이 제한 내에서)
+            batch = [message]
+            length = len(message)
+            deadline = time.monotonic() + _TELEGRAM_BATCH_WINDOW
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    message = self.telegram_queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if message is None:  # 남은 묶음을 전송한 뒤 종료
+                    stopping = True
+                    break
+                length += len(_TELEGRAM_BATCH_SEPARATOR) + len(message)
+                if length > _TELEGRAM_MAX_LENGTH:
+                    self._send_telegram_batch(batch)
+                    batch = []
+                    length = len(message)
+                batch.append(message)
+
+            self._send_telegram_batch(batch)
+
+    def _send_telegram_batch(self, batch: List[str]):
+        """(텔레그램 스레드에서 실행) 묶은 알림 메시지를 한 번의 요청으로 전송"""
+        try:
+            self.telegram_bot.send_alert(_TELEGRAM_BATCH_SEPARATOR.join(batch))
+            return
+        except TelegramSendError as e:
+            self._log_buffered(f"❌ 텔레그램 알림 전송 오류: {e}")
+        if len(batch) == 1:
+            return
+
+        # 묶음 전송 실패 시 (Markdown 파싱 오류 등) 메시지 하나 때문에 전부 유실되지 않도록 개별 재전송
+        self._log_buffered(f"🔁 텔레그램 알림 {len(batch)}건 개별 재전송")
+        for message in batch:
+            try:
+                self.telegram_bot.send_alert(message)
+            except TelegramSendError as e:
+                self._log_buffered(f"❌ 텔레그램 알림 전송 오류: {e}")
+
     def start(self):
         """실시간 모니터링 시작"""
         try:
@@ -197,24 +351,27 @@ class NBunBot:
             self.monitoring_codes = codes
             self.log(f"모니터링 대상 종목: {len(codes)}개")
 
-            # 2. 데이터 구조 초기화
-            self.minute_data = {code: deque(
-                maxlen=self.config.LOOKBACK_CANDLES + 1) for code in codes}
-            self.ongoing_candles = {}
-            self.alerted = {}
-            self.last_check_time = {}
-
-            # 3. 실시간 시세 등록 (100개씩)
-            for i in range(len(codes) // 100 + 1):
-                subset = codes[i*100:(i+1)*100]
-                reg_type = "0" if i == 0 else "1"
-                if subset:
-                    self.kiwoom.SetRealReg(
-                        str(1000+i),
-                        ";".join(subset),
-                        "10;15;20",  # 10=현재가, 15=거래량, 20=체결시간
-                        reg_type
-                    )
+            # 2. 데이터 구조 초기화 (종목명은 시작 시 한 번만 조회)
+            self.states = {
+                code: CodeState(
+                    name=self.kiwoom.GetMasterCodeName(code),
+                    prev_amounts=deque(maxlen=self.config.LOOKBACK_CANDLES + 1)
+                )
+                for code in codes
+            }
+            self.needs_tr_filters = self.config.ENABLE_MA_ALIGNMENT or self.config.ENABLE_TRADER_SELL
+
+            # 3. 실시간 시세 등록 (100개씩, 등록 단위는 실행 중 바뀌지 않으므로 미리 구성)
+            chunk_size = 100
+            self._real_reg_batches = [
+                (
+                    str(1000 + start // chunk_size),
+                    ";".join(codes[start:start + chunk_size]),
+                    "0" if start == 0 else "1"
+                )
+                for start in range(0, len(codes), chunk_size)
+            ]
+            self._register_real_data()
             self.log(f"{len(codes)}개 종목 실시간 데이터 수신 등록 완료")
 
             # 4. 이벤트 핸들러 연결
@@ -224,12 +381,10 @@ class NBunBot:
             # 5. 타이머 및 초기 데이터 로드
             if self.config.ENABLE_PROGRAM:
                 self._execute_refresh_program_codes()  # 시작 시 즉시 실행
-                # 주기적 실행을 위한 타이머 설정
-                self.program_refresh_timer = threading.Timer(
-                    self.config.PROGRAM_REFRESH_INTERVAL,
-                    self._schedule_refresh_program_codes
-                )
-                self.program_refresh_timer.start()
+                # 주기적 갱신 요청은 세션 동안 유지되는 하나의 스레드에서 처리
+                self.program_refresh_thread = threading.Thread(
+                    target=self._program_refresh_loop, daemon=True)
+                self.program_refresh_thread.start()
 
             # 6. 텔레그램 시작 메시지 전송
             if self.telegram_bot:
@@ -247,38 +402,90 @@ class NBunBot:
         """실시간 모니터링 중지"""
         if not self.is_running:
             return
+        self._log_error_summary()
+        self._flush_logs()
         self.log("모니터링 중지 시작...")
         self.is_running = False
 
-        if self.program_refresh_timer:
-            self.program_refresh_timer.cancel()
+        self._stop_evt.set()
+        win32event.SetEvent(self._wake)
 
         if self.kiwoom:
             self.kiwoom.SetRealRemove('ALL', 'ALL')
             self.log("실시간 데이터 수신 해제")
 
+        if self.telegram_thread:
+            # 남은 알림을 먼저 전송한 뒤 스레드 종료
+            self.telegram_queue.put(None)
+            self.telegram_thread.join(timeout=5)
+            # 종료 직전 전송 중 발생한 오류/재전송 로그 출력
+            self._flush_logs()
+
         if self.telegram_bot:
             self.telegram_bot.send_stop_message()
+            self.telegram_bot.close()
 
         self.log("✅ 모니터링이 중지되었습니다.")
 
+    def _register_real_data(self):
+        """미리 구성한 등록 단위로 실시간 시세 등록"""
+        for screen_no, code_list, reg_type in self._real_reg_batches:
+            self.kiwoom.SetRealReg(
+                screen_no,
+                code_list,
+                "10;15;20",  # 10=현재가, 15=거래량, 20=체결시간
+                reg_type
+            )
+
     def _run_loop(self):
         """메인 이벤트 루프: COM 메시지 처리 및 요청 큐 확인"""
         self.log("메인 루프 시작. (Ctrl+C로 종료)")
         while self.is_running:
-            # 1. 요청 큐에서 작업 확인 및 실행
-            try:
-                request_type, payload = self.request_queue.get_nowait()
-                if request_type == "REFRESH_PROGRAM_CODES":
-                    self._execute_refresh_program_codes()
-                elif request_type == "CHECK_TR_FILTERS":
-                    self._execute_tr_filters(payload)
-            except queue.Empty:
-                pass
+            # 1. COM 메시지 또는 다른 스레드의 요청이 들어올 때까지 대기 (최대 50ms)
+            win32event.MsgWaitForMultipleObjects(
+                [self._wake], False, 50, win32event.QS_ALLINPUT)
 
             # 2. COM 메시지 처리
             pythoncom.PumpWaitingMessages()
-            time.sleep(0.01)
+
+            # 3. 요청 큐에 쌓인 작업 일괄 실행 (방금 처리한 실시간 이벤트의 요청 포함)
+            self._process_requests()
+
+            # 4. 예외 집계 구간이 끝났으면 요약 출력 후 쌓인 로그 출력
+            self._roll_error_window()
+            self._flush_logs()
+
+    def _process_requests(self):
+        """(메인 스레드에서 실행) 요청 큐에 쌓인 작업을 한 번에 꺼내 중복 제거 후 실행"""
+        if not self.request_queue:
+            return
+
+        # 처리 중 새로 들어오는 요청은 다음 루프에서 처리
+        refresh_requested = False
+        tr_requests: Dict[Tuple[str, str], Dict] = {}  # (종목코드, 분) -> 가장 최근 payload
+        for _ in range(len(self.request_queue)):
+            request_type, payload = self.request_queue.popleft()
+            if request_type == "REFRESH_PROGRAM_CODES":
+                refresh_requested = True
+            elif request_type == "CHECK_TR_FILTERS":
+                key = (payload['code'], payload['current_minute'])
+                replaced = tr_requests.get(key)
+                if replaced is not None:
+                    self._release_payload(replaced)
+                tr_requests[key] = payload
+
+        # 프로그램 순매수 갱신은 한 번만, TR 필터는 종목/분당 한 번만 실행
+        if refresh_requested:
+            self._execute_refresh_program_codes()
+        for payload in tr_requests.values():
+            self._execute_tr_filters(payload)
+            self._release_payload(payload)
+
+    def _release_payload(self, payload: Dict):
+        """다 쓴 payload를 비워서 풀에 반환 (풀 크기 제한)"""
+        if len(self._payload_pool) < _PAYLOAD_POOL_SIZE:
+            payload.clear()
+            self._payload_pool.append(payload)
 
     def _get_conditions_text(self) -> str:
         """텔레그램 메시지에 포함될 조건 텍스트 생성"""
@@ -337,21 +544,15 @@ class NBunBot:
 
         return message
 
-    def _schedule_refresh_program_codes(self):
-        """(보조 스레드에서 실행) 메인 스레드에 프로그램 순매수 갱신을 요청"""
-        if not self.is_running:
-            return
-
-        # 메인 스레드가 처리하도록 큐에 요청 추가
-        self.request_queue.put(("REFRESH_PROGRAM_CODES", None))
-
-        # 다음 타이머 설정
-        if self.is_running:
-            self.program_refresh_timer = threading.Timer(
-                self.config.PROGRAM_REFRESH_INTERVAL,
-                self._schedule_refresh_program_codes
-            )
-            self.program_refresh_timer.start()
+    def _program_refresh_loop(self):
+        """(보조 스레드에서 실행) 주기마다 메인 스레드에 프로그램 순매수 갱신을 요청"""
+        while self.is_running:
+            # 종료 신호가 오면 주기를 기다리지 않고 바로 종료
+            if self._stop_evt.wait(self.config.PROGRAM_REFRESH_INTERVAL):
+                break
+            # 메인 스레드가 처리하도록 큐에 요청 추가 후 메인 루프 깨우기
+            self.request_queue.append(("REFRESH_PROGRAM_CODES", None))
+            win32event.SetEvent(self._wake)
 
     def _execute_refresh_program_codes(self):
         """(메인 스레드에서 실행) 실제 프로그램 순매수 데이터를 조회하고 갱신"""
@@ -363,127 +564,198 @@ class NBunBot:
             self.is_requesting = True
             codes = screen_by_program(self.kiwoom, self.config.PROGRAM_COUNT)
             if codes:
-                self.program_top_codes = codes
+                self.program_ranks = {c: rank for rank, c in enumerate(codes, start=1)}
                 self.log(f"[프로그램 순매수] 상위 {len(codes)}개 종목 갱신 완료")
             else:
                 self.log("[프로그램 순매수] 조회 실패 - 이전 데이터 유지")
         finally:
             self.is_requesting = False
 
+    def _handle_uncaught_exception(self, exc_type, exc_value, exc_tb):
+        """
+        sys.excepthook: 이벤트 핸들러에서 처리되지 않은 예외 출력
+
+        실시간 틱마다 같은 오류가 반복될 수 있으므로 예외 종류별로 집계 구간
+        (_ERROR_WINDOW_SECONDS)마다 첫 건은 traceback까지, 이후 몇 건은 repr만 출력하고
+        나머지는 구간이 끝날 때 요약만 출력
+        """
+        if issubclass(exc_type, KeyboardInterrupt):
+            # 이벤트 핸들러 실행 중 Ctrl+C가 들어오면 예외가 루프까지 전달되지 않으므로
+            # 메인 루프를 종료시켜 main()에서 stop()이 실행되도록 함
+            print("\nCtrl+C 입력. 종료합니다.")
+            self.is_running = False
+            return
+
+        self._roll_error_window()
+
+        name = exc_type.__name__
+        self._err_count[name] += 1
+        count = self._err_count[name]
+        if count == 1:
+            # 구간 내 첫 발생은 원인 위치를 알 수 있도록 traceback 포함
+            detail = "".join(traceback.format_exception(exc_type, exc_value, exc_tb)).rstrip()
+            self._log_buffered(f"❌ 처리되지 않은 오류: {exc_value!r}\n{detail}")
+        elif count <= _ERROR_LOG_LIMIT:
+            self._log_buffered(f"❌ 처리되지 않은 오류: {exc_value!r}")
+
+    def _roll_error_window(self):
+        """예외 집계 구간이 끝났으면 요약을 출력하고 새 구간 시작"""
+        now = time.monotonic()
+        if now - self._err_window_start >= _ERROR_WINDOW_SECONDS:
+            self._log_error_summary()
+            self._err_window_start = now
+
+    def _log_error_summary(self):
+        """집계 구간 동안 출력하지 않은 예외 건수 요약 후 초기화"""
+        suppressed = {
+            name: count - _ERROR_LOG_LIMIT
+            for name, count in self._err_count.items()
+            if count > _ERROR_LOG_LIMIT
+        }
+        if suppressed:
+            summary = ", ".join(f"{name} {count}건" for name, count in suppressed.items())
+            self._log_buffered(f"⚠️ 최근 {_ERROR_WINDOW_SECONDS}초간 생략된 오류: {summary}")
+        self._err_count.clear()
+
     def _on_receive_real_data(self, sCode: str, sRealType: str, sRealData: str):
         """실시간 데이터 수신 핸들러"""
-        if sRealType != "주식체결":
+        if sRealType != _REAL_TYPE_TRADE:
+            return
+        # 모니터링 대상이 아닌 종목은 파싱 전에 제외
+        state = self.states.get(sCode)
+        if state is None:
             return
 
-        try:
-            # 데이터 추출
-            price = safe_int(self.kiwoom.GetCommRealData(
-                sCode, 10), use_abs=True)
-            volume = safe_int(self.kiwoom.GetCommRealData(
-                sCode, 15), use_abs=True)
-            exec_time_str = self.kiwoom.GetCommRealData(sCode, 20)  # "HHMMSS"
-            current_minute = exec_time_str[:4]  # "HHMM"
-
-            # 데이터 유효성 체크
-            if price <= 0 or volume <= 0:
+        # 데이터 추출: sRealData를 직접 파싱하고, 형식이 다를 때만 GetCommRealData(COM) 조회
+        # 예외 처리는 핸들러마다 하지 않고 sys.excepthook(_handle_uncaught_exception)에 맡김
+        fields = _parse_real_data(sRealData)
+        if fields is None:
+            fields = self._get_real_fields(sCode)
+            if fields is None:
                 return
+        price, volume, exec_time_str = fields  # exec_time_str: "HHMMSS"
 
-            # 분봉 데이터 업데이트
-            self._update_candle_data(sCode, current_minute, price, volume)
+        # 데이터 유효성 체크
+        if price <= 0 or volume <= 0:
+            return
+        current_minute = exec_time_str[:4]  # "HHMM"
 
-            # 알림 조건 체크
-            self._check_and_alert(sCode, current_minute, exec_time_str)
+        # 분봉 데이터 업데이트
+        self._update_candle_data(state, current_minute, price, volume)
 
-        except Exception as e:
-            self.log(f"❌ _on_receive_real_data 오류 ({sCode}): {e}")
-            traceback.print_exc()
+        # 이번 분에 이미 알림을 보낸 종목은 체크 생략
+        if state.alerted_minute == current_minute:
+            return
 
-    def _update_candle_data(self, code: str, current_minute: str, price: int, volume: int):
+        # 알림 조건 체크
+        self._check_and_alert(sCode, state, current_minute, exec_time_str)
+
+    def _get_real_fields(self, code: str) -> Optional[Tuple[int, int, str]]:
+        """GetCommRealData로 (현재가, 거래량, 체결시간) 조회 (유효하지 않은 값이 나오면 나머지 필드는 조회하지 않음)"""
+        get_real_data = self.kiwoom.GetCommRealData
+        price = _parse_abs_int(get_real_data(code, 10))
+        if price <= 0:
+            return None
+        volume = _parse_abs_int(get_real_data(code, 15))
+        if volume <= 0:
+            return None
+        exec_time_str = get_real_data(code, 20)
+        if len(exec_time_str) < 6:
+            return None
+        return price, volume, exec_time_str
+
+    def _update_candle_data(self, state: CodeState, current_minute: str, price: int, volume: int):
         """분봉 데이터 업데이트"""
-        if code not in self.ongoing_candles:
-            self.ongoing_candles[code] = {}
+        candle = state.candle
+
+        # 같은 분 내에서 데이터 갱신
+        if candle is not None and state.minute == current_minute:
+            if price > candle[HIGH]:
+                candle[HIGH] = price
+            if price < candle[LOW]:
+                candle[LOW] = price
+            candle[CLOSE] = price
+            candle[VOLUME] += volume
+            return
 
         # 새로운 분이 시작되면 이전 분 데이터를 확정 분봉으로 저장
-        if current_minute not in self.ongoing_candles[code]:
-            if self.ongoing_candles[code]:
-                prev_minute = max(self.ongoing_candles[code].keys())
-                prev_data = self.ongoing_candles[code][prev_minute]
-
-                if code in self.minute_data:
-                    self.minute_data[code].append((prev_minute, prev_data))
-
-                del self.ongoing_candles[code][prev_minute]
-
-                # 새로운 분이 시작되면 알림 기록 초기화
-                if code in self.alerted:
-                    del self.alerted[code]
-
-            # 새 분 데이터 초기화
-            self.ongoing_candles[code][current_minute] = {
-                "open": price,
-                "high": price,
-                "low": price,
-                "close": price,
-                "volume": volume
-            }
-        else:
-            # 같은 분 내에서 데이터 갱신
-            d = self.ongoing_candles[code][current_minute]
-            d["high"] = max(d["high"], price)
-            d["low"] = min(d["low"], price)
-            d["close"] = price
-            d["volume"] += volume
-
-    def _check_and_alert(self, code: str, current_minute: str, exec_time_str: str):
+        if candle is not None:
+            # 확정 분봉은 이후 계산에 필요한 거래대금만 저장 (이전 분봉 비교를 사용할 때만)
+            lookback = self.config.LOOKBACK_CANDLES
+            if self.config.ENABLE_LOOKBACK and lookback > 0:
+                amounts = state.prev_amounts
+                new_amount = get_trading_amount_list(candle)
+
+                # 최근 LOOKBACK개 구간에서 빠지는 분봉의 거래대금 차감
+                evicted_amount = amounts[-lookback] if len(amounts) >= lookback else 0.0
+
+                amounts.append(new_amount)
+                amount_sum = state.prev_amount_sum + new_amount - evicted_amount
+                state.prev_amount_sum = amount_sum
+
+                # 평균/기준 거래대금은 분봉 확정 시에만 갱신
+                # (부분 데이터를 건너뛰기 위해 lookback+1개 이상 필요)
+                if len(amounts) >= lookback + 1:
+                    avg_prev_amount = amount_sum / lookback
+                    state.prev_avg_amount = avg_prev_amount
+                    state.amount_threshold = avg_prev_amount * self.config.AMOUNT_MULTIPLIER
+
+            # 새로운 분이 시작되면 알림 기록 초기화
+            state.alerted_minute = ""
+
+        # 새 분 데이터 초기화
+        state.minute = current_minute
+        state.candle = [price, price, price, price, volume]
+
+    def _check_and_alert(self, code: str, state: CodeState, current_minute: str, exec_time_str: str):
         """알림 조건 체크 및 발송 요청"""
 
         # 1. 중복 알림, 체크 방지
-        if code in self.alerted and self.alerted[code] == current_minute:
+        if state.alerted_minute == current_minute:
             return
 
-        now = time.time()
-        if now - self.last_check_time.get(code, 0) < self.config.THROTTLE_SECONDS:
+        now_ns = time.monotonic_ns()
+        if now_ns - state.last_check_ns < self.throttle_ns:
             return
-        self.last_check_time[code] = now
+        state.last_check_ns = now_ns
 
         # 2. 현재 분봉 데이터 가져오기
-        if code not in self.ongoing_candles or current_minute not in self.ongoing_candles[code]:
+        values = state.candle
+        if values is None or state.minute != current_minute:
             return
-        candle = CandleData(**self.ongoing_candles[code][current_minute])
 
         # 3. 1단계 필터링 (빠른 필터)
-        program_codes_snapshot = self.program_top_codes.copy()
-        prev_candles = list(self.minute_data.get(code, []))
         result, data = should_alert(
-            candle, prev_candles, code, program_codes_snapshot, self.config)
+            values, state.prev_avg_amount, state.amount_threshold, code, self.program_ranks, self.config)
 
         if not result:
             return
-        self.log(f"✅ {code} - 1단계 필터 통과")
+
+        # 통과한 경우에만 현재 분봉 스냅샷 생성 (values는 이후 틱에서 계속 갱신됨)
+        candle = CandleData(*values)
+        self._log_buffered(f"✅ {code} - 1단계 필터 통과")
 
         # 4. TR 필터 필요 여부 확인
-        needs_tr_filters = self.config.ENABLE_MA_ALIGNMENT or self.config.ENABLE_TRADER_SELL
-        if not needs_tr_filters:
+        if not self.needs_tr_filters:
             self._execute_final_alert(
                 code, current_minute, candle, data, exec_time_str)
             return
 
-        # 5. TR 필터링을 위해 큐에 작업 요청
-        payload = {
-            "code": code,
-            "candle": candle,
-            "data": data,
-            "current_minute": current_minute,
-            "exec_time_str": exec_time_str
-        }
-        self.request_queue.put(("CHECK_TR_FILTERS", payload))
+        # 5. TR 필터링을 위해 큐에 작업 요청 (payload dict는 풀에서 재사용)
+        payload = self._payload_pool.pop() if self._payload_pool else {}
+        payload["code"] = code
+        payload["candle"] = candle
+        payload["data"] = data
+        payload["current_minute"] = current_minute
+        payload["exec_time_str"] = exec_time_str
+        self.request_queue.append(("CHECK_TR_FILTERS", payload))
 
     def _execute_tr_filters(self, payload: Dict):
         """(메인 스레드에서 실행) TR 조회가 필요한 필터들을 체크하고 최종 알림 발송"""
         code = payload['code']
 
         if self.is_requesting:
-            self.log(f"[{code}] 다른 TR 조회 진행 중 - TR 필터 스킵")
+            self._log_buffered(f"[{code}] 다른 TR 조회 진행 중 - TR 필터 스킵")
             return
 
         try:
@@ -496,7 +768,7 @@ class NBunBot:
                 )
                 if not is_aligned:
                     return
-                self.log(f"✅ {code} - MA 정배열 필터 통과")
+                self._log_buffered(f"✅ {code} - MA 정배열 필터 통과")
 
             # 거래원 매도 우위 체크
             if self.config.ENABLE_TRADER_SELL:
@@ -505,7 +777,7 @@ class NBunBot:
                 )
                 if not is_sell_dominant:
                     return
-                self.log(f"✅ {code} - 거래원 매도 우위 필터 통과")
+                self._log_buffered(f"✅ {code} - 거래원 매도 우위 필터 통과")
 
             # 모든 필터 통과 시 최종 알림 실행
             self._execute_final_alert(
@@ -524,8 +796,9 @@ class NBunBot:
         # HH:MM:SS
         time = f"{exec_time_str[:2]}:{exec_time_str[2:4]}:{exec_time_str[4:6]}"
 
-        # 종목명 조회
-        name = self.kiwoom.GetMasterCodeName(code)
+        # 종목명 조회 (시작 시 미리 조회한 캐시 사용)
+        state = self.states.get(code)
+        name = state.name if state is not None and state.name else code
 
         alert = AlertInfo(
             time=time,
@@ -539,15 +812,16 @@ class NBunBot:
         )
 
         # 알림 기록
-        self.alerted[code] = current_minute
+        if state is not None:
+            state.alerted_minute = current_minute
 
         # 로그 출력
         message = self._get_alert_text(alert)
-        self.log(message)
+        self._log_buffered(message)
 
-        # 텔레그램 메시지 전송
+        # 텔레그램 메시지 전송 (전송 스레드에 위임)
         if self.telegram_bot:
-            self.telegram_bot.send_alert(message)
+            self.telegram_queue.put_nowait(message)
 
 
 def main():
@@ -555,6 +829,9 @@ def main():
     config = Config()
     bot = NBunBot(config)
 
+    # 실시간 이벤트 핸들러 예외를 로그로 남김 (PyQt 슬롯 예외로 인한 종료 방지)
+    sys.excepthook = bot._handle_uncaught_exception
+
     try:
         bot.start()
     except KeyboardInterrupt:
@@ -6,9 +6,12 @@
 import os
 import sys
 import time
-from datetime import datetime
-from PyQt5.QtWidgets import QApplication, QMainWindow, QTableWidgetItem, QHeaderView
-from PyQt5.QtCore import QTimer, Qt
+from collections import deque
+from operator import itemgetter
+from typing import Deque, Dict, List, NamedTuple, Optional
+from PyQt5.QtWidgets import QApplication, QMainWindow, QHeaderView
+from PyQt5.QtCore import QTimer, Qt, QAbstractTableModel, QModelIndex
+from PyQt5.QtGui import QBrush
 from PyQt5 import uic
 from dotenv import load_dotenv
 from pykiwoom.kiwoom import Kiwoom
@@ -23,12 +26,107 @@ from scripts.api.filters import (
 )  # noqa: E402
 from scripts.api.screening import screen_by_custom_condition  # noqa: E402
 from scripts.api.market_data import get_stock_info  # noqa: E402
+from scripts.api.utils.formatters import format_clock  # noqa: E402
 
 
 # 환경변수 로드
 load_dotenv()
 
 
+class Row(NamedTuple):
+    """스캔 결과 테이블 한 행"""
+    code: str
+    name: str
+    price: int
+    change_rate: float
+    price_change: int
+    volume: int
+    time: str
+
+
+class StockTableModel(QAbstractTableModel):
+    """스캔 결과 테이블 모델 (Row 리스트를 그대로 표시, 셀별 아이템 객체 생성 없음)"""
+
+    HEADERS = ['종목코드', '종목명', '현재가', '등락률', '전일대비', '거래량', '선정시간']
+
+    # 셀마다 새로 만들지 않도록 정렬/색상 값은 한 번만 생성
+    _ALIGN_RIGHT = int(Qt.AlignRight | Qt.AlignVCenter)
+    _BRUSH_RED = QBrush(Qt.red)
+    _BRUSH_BLUE = QBrush(Qt.blue)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.rows: List[Row] = []
+        self._sort_column: Optional[int] = None
+        self._sort_order = Qt.AscendingOrder
+
+    def set_rows(self, rows: List[Row]):
+        """전체 행 교체 (마지막 정렬 기준 유지)"""
+        self.beginResetModel()
+        self.rows = list(rows)
+        if self._sort_column is not None:
+            self._sort_rows()
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        # 세로 헤더(행 번호) 등은 기본 동작 사용
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row = self.rows[index.row()]
+        column = index.column()
+
+        if role == Qt.DisplayRole:
+            if column == 2:  # 현재가
+                return f"{row.price:,}"
+            if column == 3:  # 등락률
+                return f"{row.change_rate:+.2f}%"
+            if column == 4:  # 전일대비
+                return f"{row.price_change:+,}"
+            if column == 5:  # 거래량
+                return f"{row.volume:,}"
+            return row[column]
+
+        if role == Qt.TextAlignmentRole:
+            if 2 <= column <= 5:
+                return self._ALIGN_RIGHT
+            return None
+
+        if role == Qt.ForegroundRole:
+            if column in (3, 4):  # 등락률, 전일대비
+                value = row[column]
+                if value > 0:
+                    return self._BRUSH_RED
+                if value < 0:
+                    return self._BRUSH_BLUE
+            return None
+
+        return None
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        """헤더 클릭 시 원본 값 기준 정렬"""
+        self.layoutAboutToBeChanged.emit()
+        self._sort_column = column
+        self._sort_order = order
+        self._sort_rows()
+        self.layoutChanged.emit()
+
+    def _sort_rows(self):
+        self.rows.sort(key=itemgetter(self._sort_column),
+                       reverse=self._sort_order == Qt.DescendingOrder)
+
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -42,6 +140,7 @@ class MainWindow(QMainWindow):
         self.kiwoom = None
         self.account = None
         self.conditions = []  # 조건식 리스트
+        self.code_names: Dict[str, str] = {}  # 종목코드 -> 종목명 캐시
 
         # 타이머 설정
         self.scan_timer = QTimer()
@@ -52,6 +151,13 @@ class MainWindow(QMainWindow):
             self.update_countdown)  # 1초마다 countdown_remaining 값 업데이트
         self.countdown_remaining = 0
 
+        # 로그는 버퍼에 모아 100ms마다 한 번에 출력
+        self.pending_logs: Deque[str] = deque(maxlen=5000)
+        self.dropped_log_count = 0  # 버퍼가 가득 차서 버려진 로그 수
+        self.log_flush_timer = QTimer()
+        self.log_flush_timer.timeout.connect(self.flush_logs)
+        self.log_flush_timer.start(100)
+
         # 스캔 중지 플래그
         self.stop_requested = False
 
@@ -67,6 +173,9 @@ class MainWindow(QMainWindow):
 
     def setup_table(self):
         """테이블 초기 설정"""
+        self.stock_model = StockTableModel(self)
+        self.stock_table.setModel(self.stock_model)
+
         # 헤더 크기 조정
         header = self.stock_table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeToContents)  # 종목코드
@@ -106,10 +215,22 @@ class MainWindow(QMainWindow):
                 "color: red; font-weight: bold;")
 
     def log(self, message):
-        """로그 출력"""
-        timestamp = datetime.now().strftime('%H:%M:%S')
-        self.log_browser.append(f"[{timestamp}] {message}")
-        QApplication.processEvents()  # 로그 출력 시마다 GUI 자동 업데이트
+        """로그 출력 (버퍼에 추가, flush_logs에서 출력)"""
+        timestamp = format_clock()
+        # 버퍼가 가득 찬 상태에서 추가하면 가장 오래된 로그가 버려지므로 개수 기록
+        if len(self.pending_logs) == self.pending_logs.maxlen:
+            self.dropped_log_count += 1
+        self.pending_logs.append(f"[{timestamp}] {message}")
+
+    def flush_logs(self):
+        """버퍼에 쌓인 로그를 한 번에 출력"""
+        if not self.pending_logs:
+            return
+        if self.dropped_log_count:
+            self.log_browser.append(f"⚠️ 로그 {self.dropped_log_count}줄 생략됨 (버퍼 초과)")
+            self.dropped_log_count = 0
+        self.log_browser.append("\n".join(self.pending_logs))
+        self.pending_logs.clear()
 
     def load_conditions(self):
         """조건식 리스트 로드"""
@@ -190,11 +311,21 @@ class MainWindow(QMainWindow):
 
     def should_stop(self):
         """중지 요청 확인 및 로그 출력"""
+        # 스캔 단계 사이에서만 이벤트 처리 (로그/중지 버튼 반영)
+        QApplication.processEvents()
         if self.stop_requested:
             self.log("스캔 중지됨")
             return True
         return False
 
+    def get_stock_name(self, code):
+        """종목명 조회 (세션 중 변하지 않으므로 한 번 조회한 값은 캐시)"""
+        name = self.code_names.get(code)
+        if name is None:
+            name = self.kiwoom.GetMasterCodeName(code)
+            self.code_names[code] = name
+        return name
+
     def get_filter_parameters(self):
         """GUI에서 필터링 파라미터 값 읽기"""
         return {
@@ -297,40 +428,40 @@ class MainWindow(QMainWindow):
                     )
 
                     if stock_info:
-                        result_stocks.append({
-                            'code': stock_info['code'],
-                            'name': stock_info['name'],
-                            'price': stock_info['current_price'],
-                            'change_rate': stock_info['change_rate'],
-                            'price_change': stock_info['price_change'],
-                            'volume': stock_info['volume'],
-                            'time': datetime.now().strftime('%H:%M:%S')
-                        })
+                        result_stocks.append(Row(
+                            code=stock_info['code'],
+                            name=stock_info['name'],
+                            price=stock_info['current_price'],
+                            change_rate=stock_info['change_rate'],
+                            price_change=stock_info['price_change'],
+                            volume=stock_info['volume'],
+                            time=format_clock()
+                        ))
                     else:
                         self.log(f"  ✗ {code} 정보 조회 실패")
                         # 기본 정보만 추가
-                        result_stocks.append({
-                            'code': code,
-                            'name': self.kiwoom.GetMasterCodeName(code),
-                            'price': 0,
-                            'change_rate': 0.0,
-                            'price_change': 0,
-                            'volume': 0,
-                            'time': datetime.now().strftime('%H:%M:%S')
-                        })
+                        result_stocks.append(Row(
+                            code=code,
+                            name=self.get_stock_name(code),
+                            price=0,
+                            change_rate=0.0,
+                            price_change=0,
+                            volume=0,
+                            time=format_clock()
+                        ))
 
                 except Exception as e:
                     self.log(f"  ✗ {code} 정보 조회 실패: {str(e)}")
                     # 기본 정보만 추가
-                    result_stocks.append({
-                        'code': code,
-                        'name': self.kiwoom.GetMasterCodeName(code),
-                        'price': 0,
-                        'change_rate': 0.0,
-                        'price_change': 0,
-                        'volume': 0,
-                        'time': datetime.now().strftime('%H:%M:%S')
-                    })
+                    result_stocks.append(Row(
+                        code=code,
+                        name=self.get_stock_name(code),
+                        price=0,
+                        change_rate=0.0,
+                        price_change=0,
+                        volume=0,
+                        time=format_clock()
+                    ))
 
             # 결과 표시
             self.update_table(result_stocks)
@@ -348,60 +479,13 @@ class MainWindow(QMainWindow):
         self.stat_volume_count.setText(str(stats['volume_count']))
         self.stat_final_count.setText(str(stats['final_count']))
 
-    def update_table(self, stocks):
+    def update_table(self, stocks: List[Row]):
         """테이블 업데이트"""
-        # 기존 데이터 클리어
-        self.stock_table.setRowCount(0)
-
-        # 새 데이터 추가
-        for stock in stocks:
-            row_position = self.stock_table.rowCount()
-            self.stock_table.insertRow(row_position)
-
-            # 종목코드
-            self.stock_table.setItem(
-                row_position, 0, QTableWidgetItem(stock['code']))
-
-            # 종목명
-            self.stock_table.setItem(
-                row_position, 1, QTableWidgetItem(stock['name']))
-
-            # 현재가
-            price_item = QTableWidgetItem(f"{stock['price']:,}")
-            price_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            self.stock_table.setItem(row_position, 2, price_item)
-
-            # 등락률
-            change_rate = stock['change_rate']
-            change_item = QTableWidgetItem(f"{change_rate:+.2f}%")
-            change_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            if change_rate > 0:
-                change_item.setForeground(Qt.red)
-            elif change_rate < 0:
-                change_item.setForeground(Qt.blue)
-            self.stock_table.setItem(row_position, 3, change_item)
-
-            # 전일대비
-            price_change = stock['price_change']
-            price_change_item = QTableWidgetItem(f"{price_change:+,}")
-            price_change_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            if price_change > 0:
-                price_change_item.setForeground(Qt.red)
-            elif price_change < 0:
-                price_change_item.setForeground(Qt.blue)
-            self.stock_table.setItem(row_position, 4, price_change_item)
-
-            # 거래량
-            volume_item = QTableWidgetItem(f"{stock['volume']:,}")
-            volume_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            self.stock_table.setItem(row_position, 5, volume_item)
-
-            # 선정시간
-            self.stock_table.setItem(
-                row_position, 6, QTableWidgetItem(stock['time']))
+        # 모델 리셋 한 번으로 전체 행 교체
+        self.stock_model.set_rows(stocks)
 
         # 마지막 업데이트 시간
-        self.last_update_time.setText(datetime.now().strftime('%H:%M:%S'))
+        self.last_update_time.setText(format_clock())
 
 
 def main():